@@ -27,6 +27,10 @@ public class VoxelCraiConfigScreen extends Screen {
     private IntensitySlider shadowIntensitySlider;
     private IntensitySlider reflectionIntensitySlider;
     
+    // 📊 Кэш строки памяти (пересобирается только при изменении слайдера)
+    private int cachedPatternCount = -1;
+    private Text cachedMemoryText;
+    
     public VoxelCraiConfigScreen(Screen parent) {
         super(Text.literal("🔮 VoxelCraiMod - Настройки"));
         this.parent = parent;
@@ -106,12 +110,9 @@ public class VoxelCraiConfigScreen extends Screen {
         );
         
         // 📊 Информация о памяти
-        int patternCount = patternCountSlider.getValue();
-        int memoryKB = patternCount * 1024 / 1024;  // 1KB на паттерн
-        
         context.drawCenteredTextWithShadow(
             this.textRenderer,
-            Text.literal(String.format("📊 Память: %d KB (%.1f MB)", memoryKB, memoryKB / 1024.0f)),
+            getMemoryText(),
             this.width / 2, this.height - 30,
             0xAAAAAA
         );
@@ -119,6 +120,22 @@ public class VoxelCraiConfigScreen extends Screen {
         super.render(context, mouseX, mouseY, delta);
     }
     
+    /**
+     * 📊 Строка памяти - форматируется только при изменении количества паттернов
+     */
+    private Text getMemoryText() {
+        int patternCount = patternCountSlider.getValue();
+        
+        if (cachedMemoryText == null || patternCount != cachedPatternCount) {
+            int memoryKB = patternCount * 1024 / 1024;  // 1KB на паттерн
+            cachedMemoryText = Text.literal(
+                String.format("📊 Память: %d KB (%.1f MB)", memoryKB, memoryKB / 1024.0f));
+            cachedPatternCount = patternCount;
+        }
+        
+        return cachedMemoryText;
+    }
+    
     /**
      * 💾 Сохранение и закрытие
      */
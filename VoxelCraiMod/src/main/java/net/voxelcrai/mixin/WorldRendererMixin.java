@@ -42,22 +42,4 @@ public abstract class WorldRendererMixin {
             buffer.clearDirty();
         }
     }
-    
-    /**
-     * 🎬 Хук после рендера мира
-     */
-    @Inject(method = "render", at = @At("RETURN"))
-    private void voxelcrai$onRenderEnd(CallbackInfo ci) {
-        VoxelCraiMod mod = VoxelCraiMod.getInstance();
-        
-        if (mod == null || !mod.isInitialized()) {
-            return;
-        }
-        
-        // 📊 Отображение статистики (если включено)
-        if (mod.getConfig().isShowPatternCount()) {
-            LightPatternBuffer buffer = mod.getPatternBuffer();
-            // Статистика будет отображаться через HUD
-        }
-    }
 }
@@ -2,6 +2,7 @@ package net.voxelcrai.mod;
 
 import net.fabricmc.api.ClientModInitializer;
 import net.fabricmc.fabric.api.client.event.lifecycle.v1.ClientChunkEvents;
+import net.fabricmc.fabric.api.client.event.lifecycle.v1.ClientLifecycleEvents;
 import net.fabricmc.fabric.api.client.event.lifecycle.v1.ClientTickEvents;
 import net.fabricmc.fabric.api.resource.ResourceManagerHelper;
 import net.minecraft.resource.ResourceType;
@@ -45,6 +46,14 @@ public class VoxelCraiMod implements ClientModInitializer {
     private boolean initialized = false;
     private int tickCounter = 0;
     
+    // 🌅 Входы последнего динамического обновления (для пропуска без изменений)
+    private static final float DYNAMIC_UPDATE_EPSILON = 1.0e-4f;
+    private static final int DYNAMIC_FORCED_REFRESH_INTERVALS = 8;  // принудительно раз в 8 интервалов
+    private float lastTimeOfDay = Float.NaN;
+    private float lastRainGradient = Float.NaN;
+    private long lastPatternVersion = -1;
+    private int intervalsSinceDynamicUpdate = 0;
+    
     @Override
     public void onInitializeClient() {
         INSTANCE = this;
@@ -94,12 +103,17 @@ public class VoxelCraiMod implements ClientModInitializer {
             int chunkZ = chunk.getPos().z;
             
             LOGGER.debug("🌍 Чанк загружен: [{}, {}]", chunkX, chunkZ);
+            patternGenerator.onChunkLoaded(chunkX, chunkZ);
             
             // Асинхронная генерация паттернов для чанка
+            // Результат ставится в очередь и применяется в тике клиента
+            long chunkKey = PatternGenerator.getChunkKey(chunkX, chunkZ);
             patternGenerator.generateForChunkAsync(chunk, patterns -> {
-                patternBuffer.updatePatterns(patterns);
-                LOGGER.debug("✨ Паттерны обновлены для чанка [{}, {}]: {} шт", 
-                    chunkX, chunkZ, patterns.size());
+                patternBuffer.submitPatterns(chunkKey, patterns);
+                if (LOGGER.isDebugEnabled()) {
+                    LOGGER.debug("✨ Паттерны поставлены в очередь для чанка [{}, {}]: {} шт", 
+                        chunkX, chunkZ, patterns.size());
+                }
             });
         });
         
@@ -116,21 +130,58 @@ public class VoxelCraiMod implements ClientModInitializer {
         
         // ⏱️ Тик клиента - обновление паттернов
         ClientTickEvents.END_CLIENT_TICK.register(client -> {
-            if (!initialized || client.world == null) return;
+            if (!initialized) return;
+            
+            // 🚪 Мира нет - пачки от прошлого мира применять некуда
+            if (client.world == null) {
+                patternBuffer.discardPendingPatterns();
+                return;
+            }
+            
+            // 📥 Применяем готовые пачки одной блокировкой (кроме пачек уже выгруженных чанков)
+            patternBuffer.drainPendingPatterns(patternGenerator::acceptChunkBatch);
+            
+            // ⏸️ На паузе мир не тикает - динамические паттерны обновлять незачем
+            if (client.isPaused()) return;
             
             tickCounter++;
             
-            // Обновление каждые 20 тиков (1 секунда)
-            if (tickCounter >= 20) {
+            // Обновление раз в updateIntervalTicks (по умолчанию 20 тиков = 1 секунда)
+            if (tickCounter >= config.getUpdateIntervalTicks()) {
                 tickCounter = 0;
                 
                 // 🔄 Обновление динамических паттернов (время суток, погода)
                 float timeOfDay = client.world.getTimeOfDay() / 24000.0f;
                 float rainGradient = client.world.getRainGradient(1.0f);
                 
-                patternGenerator.updateDynamicPatterns(timeOfDay, rainGradient);
+                long patternVersion = patternBuffer.getVersion();
+                intervalsSinceDynamicUpdate++;
+                
+                // Пропускаем, только если время суток и погода стоят, новых паттернов
+                // не появилось и принудительное обновление еще не подошло
+                boolean inputsUnchanged = Math.abs(timeOfDay - lastTimeOfDay) < DYNAMIC_UPDATE_EPSILON
+                        && Math.abs(rainGradient - lastRainGradient) < DYNAMIC_UPDATE_EPSILON;
+                boolean patternsUnchanged = patternVersion == lastPatternVersion;
+                
+                if (!inputsUnchanged || !patternsUnchanged
+                        || intervalsSinceDynamicUpdate >= DYNAMIC_FORCED_REFRESH_INTERVALS) {
+                    lastTimeOfDay = timeOfDay;
+                    lastRainGradient = rainGradient;
+                    lastPatternVersion = patternVersion;
+                    intervalsSinceDynamicUpdate = 0;
+                    
+                    patternGenerator.updateDynamicPatterns(timeOfDay, rainGradient);
+                }
             }
         });
+        
+        // 🛑 Остановка клиента - завершение потоков генерации
+        ClientLifecycleEvents.CLIENT_STOPPING.register(client -> {
+            if (!initialized) return;
+            
+            patternGenerator.shutdown();
+            LOGGER.info("🛑 PatternGenerator остановлен");
+        });
     }
     
     /**
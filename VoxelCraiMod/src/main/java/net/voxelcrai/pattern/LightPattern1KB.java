@@ -2,6 +2,7 @@ package net.voxelcrai.pattern;
 
 import java.nio.ByteBuffer;
 import java.nio.ByteOrder;
+import java.util.Arrays;
 
 /**
  * 💡 LightPattern1KB - Структура паттерна освещения (1024 байта)
@@ -38,6 +39,15 @@ public class LightPattern1KB {
     public static final int SH_COEFFS_EXTENDED = 256;  // Расширенные SH для детальных теней
     public static final int MATERIAL_DATA_SIZE = 512;
     
+    // Хвост сериализованного формата: 1024 - 822 байт полей
+    private static final int TRAILING_PADDING_BYTES = 202;
+    private static final byte[] ZERO_PADDING = new byte[TRAILING_PADDING_BYTES];
+    
+    // Значения по умолчанию в fp16 (вычисляются один раз, а не в каждом конструкторе)
+    private static final short HALF_ZERO = floatToHalf(0.0f);
+    private static final short HALF_HALF = floatToHalf(0.5f);
+    private static final short HALF_ONE = floatToHalf(1.0f);
+    
     // 🆔 Идентификатор паттерна (8 байт)
     private long id;
     
@@ -55,12 +65,15 @@ public class LightPattern1KB {
     // Расширенная версия: 256 коэффициентов для детальных теней
     private byte[] shCoefficients;
     
+    // 🌅 Исходные bands 0-3 до динамической модуляции (не сериализуются, создаются лениво)
+    private byte[] baseShCoefficients;
+    
     // 🎨 Материалы (512 байт)
     private byte[] materialData;
     
-    // 🔧 Параметры материала
-    private float roughness;  // [0.0, 1.0]
-    private float metallic;   // [0.0, 1.0]
+    // 🔧 Параметры материала (fp16, [0.0, 1.0])
+    private short roughness;
+    private short metallic;
     
     // 🌅 Ambient Occlusion (fp16)
     private short ambientOcclusion;
@@ -93,12 +106,12 @@ public class LightPattern1KB {
         this.indirectB = 0;
         this.shCoefficients = new byte[SH_COEFFS_EXTENDED];
         this.materialData = new byte[MATERIAL_DATA_SIZE];
-        this.roughness = 0.5f;
-        this.metallic = 0.0f;
-        this.ambientOcclusion = floatToHalf(1.0f);
-        this.reflection = floatToHalf(0.0f);
-        this.refraction = floatToHalf(0.0f);
-        this.emission = floatToHalf(0.0f);
+        this.roughness = HALF_HALF;
+        this.metallic = HALF_ZERO;
+        this.ambientOcclusion = HALF_ONE;
+        this.reflection = HALF_ZERO;
+        this.refraction = HALF_ZERO;
+        this.emission = HALF_ZERO;
         this.flags = 0;
         this.posX = 0;
         this.posY = 0;
@@ -122,6 +135,7 @@ public class LightPattern1KB {
     public void setShCoefficient(int index, byte value) {
         if (index >= 0 && index < SH_COEFFS_EXTENDED) {
             shCoefficients[index] = value;
+            baseShCoefficients = null;  // новые исходные значения
         }
     }
     
@@ -163,6 +177,7 @@ public class LightPattern1KB {
     public void setShCoefficients3Bands(byte[] coeffs) {
         if (coeffs.length >= 9) {
             System.arraycopy(coeffs, 0, shCoefficients, 0, 9);
+            baseShCoefficients = null;  // новые исходные значения
         }
     }
     
@@ -172,6 +187,7 @@ public class LightPattern1KB {
     public void setShCoefficients4Bands(byte[] coeffs) {
         if (coeffs.length >= 16) {
             System.arraycopy(coeffs, 0, shCoefficients, 0, 16);
+            baseShCoefficients = null;  // новые исходные значения
         }
     }
     
@@ -195,6 +211,20 @@ public class LightPattern1KB {
         ByteBuffer buffer = ByteBuffer.allocate(SIZE_BYTES);
         buffer.order(ByteOrder.LITTLE_ENDIAN);
         
+        writeTo(buffer);
+        
+        buffer.flip();
+        return buffer;
+    }
+    
+    /**
+     * 📦 Запись паттерна в переданный буфер с его текущей позиции
+     * 
+     * Записывает ровно SIZE_BYTES байт в том же формате, что и toByteBuffer(),
+     * без выделения промежуточного буфера. Порядок байт задаёт вызывающий
+     * (ожидается LITTLE_ENDIAN).
+     */
+    public void writeTo(ByteBuffer buffer) {
         // 🆔 ID (8 байт)
         buffer.putLong(id);
         
@@ -218,8 +248,8 @@ public class LightPattern1KB {
         buffer.put(materialData);
         
         // 🔧 Roughness/Metallic (4 байта)
-        buffer.putShort(floatToHalf(roughness));
-        buffer.putShort(floatToHalf(metallic));
+        buffer.putShort(roughness);
+        buffer.putShort(metallic);
         
         // ✨ AO/Reflection/Refraction/Emission (8 байт)
         buffer.putShort(ambientOcclusion);
@@ -238,11 +268,7 @@ public class LightPattern1KB {
         // Padding до 1024 байт
         // Уже использовано: 8+8+6+6+256+512+4+8+2+12 = 822 байт
         // Нужно добавить: 1024-822 = 202 байт padding
-        byte[] padding = new byte[202];
-        buffer.put(padding);
-        
-        buffer.flip();
-        return buffer;
+        buffer.put(ZERO_PADDING);
     }
     
     /**
@@ -267,8 +293,8 @@ public class LightPattern1KB {
         buffer.get(pattern.shCoefficients);
         buffer.get(pattern.materialData);
         
-        pattern.roughness = halfToFloat(buffer.getShort());
-        pattern.metallic = halfToFloat(buffer.getShort());
+        pattern.roughness = buffer.getShort();
+        pattern.metallic = buffer.getShort();
         
         pattern.ambientOcclusion = buffer.getShort();
         pattern.reflection = buffer.getShort();
@@ -328,10 +354,9 @@ public class LightPattern1KB {
         if (exp == 0x7c00) {
             exp = 0x3fc00;
         } else if (exp != 0) {
+            // Нормализованное число: только перенос смещения экспоненты (15 -> 127),
+            // мантисса копируется как есть, поэтому степени двойки точны
             exp += 0x1c000;
-            if (mant == 0 && exp > 0x1c400) {
-                return Float.intBitsToFloat((half & 0x8000) << 16 | exp << 13 | 0x3ff);
-            }
         } else if (mant != 0) {
             exp = 0x1c400;
             do {
@@ -349,11 +374,11 @@ public class LightPattern1KB {
     public long getId() { return id; }
     public void setId(long id) { this.id = id; }
     
-    public float getRoughness() { return roughness; }
-    public void setRoughness(float roughness) { this.roughness = Math.max(0, Math.min(1, roughness)); }
+    public float getRoughness() { return halfToFloat(roughness); }
+    public void setRoughness(float roughness) { this.roughness = floatToHalf(Math.max(0, Math.min(1, roughness))); }
     
-    public float getMetallic() { return metallic; }
-    public void setMetallic(float metallic) { this.metallic = Math.max(0, Math.min(1, metallic)); }
+    public float getMetallic() { return halfToFloat(metallic); }
+    public void setMetallic(float metallic) { this.metallic = floatToHalf(Math.max(0, Math.min(1, metallic))); }
     
     public short getFlags() { return flags; }
     public void setFlags(short flags) { this.flags = flags; }
@@ -376,6 +401,19 @@ public class LightPattern1KB {
     public byte[] getShCoefficients() { return shCoefficients; }
     public byte[] getMaterialData() { return materialData; }
     
+    /**
+     * 🌅 Исходные SH коэффициенты bands 0-3 (до модуляции временем суток/погодой)
+     * 
+     * Снимок берётся при первом вызове, то есть после генерации паттерна;
+     * модуляция всегда считается от него, а не от уже модулированных значений.
+     */
+    public byte[] getBaseShCoefficients() {
+        if (baseShCoefficients == null) {
+            baseShCoefficients = Arrays.copyOf(shCoefficients, SH_COEFFS_COUNT);
+        }
+        return baseShCoefficients;
+    }
+    
     /**
      * 📊 Получение размера в байтах
      */
@@ -386,6 +424,6 @@ public class LightPattern1KB {
     @Override
     public String toString() {
         return String.format("LightPattern1KB[id=%d, pos=(%d,%d,%d), roughness=%.2f, metallic=%.2f]",
-            id, posX, posY, posZ, roughness, metallic);
+            id, posX, posY, posZ, getRoughness(), getMetallic());
     }
 }
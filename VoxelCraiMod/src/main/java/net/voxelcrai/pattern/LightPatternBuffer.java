@@ -3,9 +3,14 @@ package net.voxelcrai.pattern;
 import java.nio.ByteBuffer;
 import java.nio.ByteOrder;
 import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentLinkedQueue;
 import java.util.concurrent.locks.ReentrantReadWriteLock;
+import java.util.function.Consumer;
 
 /**
  * 💾 LightPatternBuffer - Буфер паттернов для GPU SSBO
@@ -30,10 +35,20 @@ public class LightPatternBuffer {
     private final List<LightPattern1KB> orderedPatterns;
     private final ReentrantReadWriteLock lock;
     
+    // 🗂️ ID -> позиция в orderedPatterns (под блокировкой, вместо indexOf)
+    private final Map<Long, Integer> slotById;
+    
+    // 🔁 Индекс самого старого паттерна, когда буфер заполнен (кольцевое вытеснение)
+    private int oldestIndex;
+    
+    // 📥 Пачки от асинхронной генерации (сливаются раз в тик под одной блокировкой)
+    private final ConcurrentLinkedQueue<PendingBatch> pendingBatches;
+    
     // 📊 Метаданные буфера
     private int capacity;
     private volatile boolean dirty;
     private volatile long lastUpdateTime;
+    private volatile long version;  // растет при каждом изменении содержимого
     
     // 📦 GPU буфер (lazy initialization)
     private ByteBuffer gpuBuffer;
@@ -53,7 +68,10 @@ public class LightPatternBuffer {
         this.capacity = Math.max(MIN_CAPACITY, Math.min(MAX_CAPACITY, capacity));
         this.patterns = new ConcurrentHashMap<>(capacity);
         this.orderedPatterns = new ArrayList<>(capacity);
+        this.slotById = new HashMap<>(capacity);
         this.lock = new ReentrantReadWriteLock();
+        this.pendingBatches = new ConcurrentLinkedQueue<>();
+        this.oldestIndex = 0;
         this.dirty = false;
         this.lastUpdateTime = System.currentTimeMillis();
         this.gpuBufferDirty = true;
@@ -66,13 +84,18 @@ public class LightPatternBuffer {
         lock.writeLock().lock();
         try {
             if (orderedPatterns.size() >= capacity) {
-                // 🗑️ Удаляем самый старый паттерн
-                LightPattern1KB oldest = orderedPatterns.remove(0);
+                // 🗑️ Заменяем самый старый паттерн на его месте, без сдвига списка
+                LightPattern1KB oldest = orderedPatterns.set(oldestIndex, pattern);
                 patterns.remove(oldest.getId());
+                slotById.remove(oldest.getId());
+                slotById.put(pattern.getId(), oldestIndex);
+                oldestIndex = (oldestIndex + 1) % orderedPatterns.size();
+            } else {
+                slotById.put(pattern.getId(), orderedPatterns.size());
+                orderedPatterns.add(pattern);
             }
             
             patterns.put(pattern.getId(), pattern);
-            orderedPatterns.add(pattern);
             markDirty();
         } finally {
             lock.writeLock().unlock();
@@ -85,12 +108,9 @@ public class LightPatternBuffer {
     public void updatePattern(LightPattern1KB pattern) {
         lock.writeLock().lock();
         try {
-            LightPattern1KB existing = patterns.get(pattern.getId());
-            if (existing != null) {
-                int index = orderedPatterns.indexOf(existing);
-                if (index >= 0) {
-                    orderedPatterns.set(index, pattern);
-                }
+            Integer slot = slotById.get(pattern.getId());
+            if (slot != null) {
+                orderedPatterns.set(slot, pattern);
             }
             patterns.put(pattern.getId(), pattern);
             markDirty();
@@ -105,34 +125,121 @@ public class LightPatternBuffer {
     public void updatePatterns(List<LightPattern1KB> newPatterns) {
         lock.writeLock().lock();
         try {
-            for (LightPattern1KB pattern : newPatterns) {
-                LightPattern1KB existing = patterns.get(pattern.getId());
-                if (existing != null) {
-                    int index = orderedPatterns.indexOf(existing);
-                    if (index >= 0) {
-                        orderedPatterns.set(index, pattern);
-                    }
-                    patterns.put(pattern.getId(), pattern);
-                } else if (orderedPatterns.size() < capacity) {
-                    patterns.put(pattern.getId(), pattern);
-                    orderedPatterns.add(pattern);
+            applyPatterns(newPatterns);
+            markDirty();
+        } finally {
+            lock.writeLock().unlock();
+        }
+    }
+    
+    /**
+     * 📥 Постановка пачки паттернов чанка в очередь (lock-free, из потоков генерации)
+     */
+    public void submitPatterns(long chunkKey, List<LightPattern1KB> newPatterns) {
+        pendingBatches.offer(new PendingBatch(chunkKey, newPatterns));
+    }
+    
+    /**
+     * 📥 Слив всех ожидающих пачек под одной блокировкой записи
+     * 
+     * Пачки, отклонённые фильтром (например, чанк уже выгружен),
+     * отбрасываются и в буфер не попадают.
+     * 
+     * @return количество применённых пачек
+     */
+    public int drainPendingPatterns(BatchFilter filter) {
+        if (pendingBatches.isEmpty()) {
+            return 0;
+        }
+        
+        lock.writeLock().lock();
+        try {
+            int batches = 0;
+            PendingBatch batch;
+            while ((batch = pendingBatches.poll()) != null) {
+                if (filter.accept(batch.chunkKey, batch.patterns)) {
+                    applyPatterns(batch.patterns);
+                    batches++;
                 }
             }
-            markDirty();
+            if (batches > 0) {
+                markDirty();
+            }
+            return batches;
         } finally {
             lock.writeLock().unlock();
         }
     }
     
+    /**
+     * 🗑️ Отбрасывание всех ожидающих пачек (мир выгружен)
+     */
+    public void discardPendingPatterns() {
+        pendingBatches.clear();
+    }
+    
+    /**
+     * 🔄 Применение пачки паттернов (вызывается под блокировкой записи)
+     */
+    private void applyPatterns(List<LightPattern1KB> newPatterns) {
+        for (LightPattern1KB pattern : newPatterns) {
+            Integer slot = slotById.get(pattern.getId());
+            if (slot != null) {
+                orderedPatterns.set(slot, pattern);
+                patterns.put(pattern.getId(), pattern);
+            } else if (orderedPatterns.size() < capacity) {
+                patterns.put(pattern.getId(), pattern);
+                slotById.put(pattern.getId(), orderedPatterns.size());
+                orderedPatterns.add(pattern);
+            }
+        }
+    }
+    
     /**
      * 🗑️ Удаление паттерна по ID
      */
     public void removePattern(long id) {
         lock.writeLock().lock();
         try {
-            LightPattern1KB removed = patterns.remove(id);
-            if (removed != null) {
-                orderedPatterns.remove(removed);
+            if (patterns.remove(id) != null) {
+                restoreInsertionOrder();
+                Integer slot = slotById.remove(id);
+                if (slot != null) {
+                    orderedPatterns.remove((int) slot);
+                    
+                    // Сдвинулись только паттерны после удаленного
+                    for (int i = slot; i < orderedPatterns.size(); i++) {
+                        slotById.put(orderedPatterns.get(i).getId(), i);
+                    }
+                }
+                markDirty();
+            }
+        } finally {
+            lock.writeLock().unlock();
+        }
+    }
+    
+    /**
+     * 🗑️ Массовое удаление паттернов по ID (например, всех паттернов чанка)
+     * 
+     * Один проход по списку и один пересчёт позиций на всю пачку
+     * вместо сдвига списка на каждый ID.
+     */
+    public void removePatterns(long[] ids) {
+        lock.writeLock().lock();
+        try {
+            int removedCount = 0;
+            for (long id : ids) {
+                if (patterns.remove(id) != null) {
+                    removedCount++;
+                }
+            }
+            
+            if (removedCount > 0) {
+                restoreInsertionOrder();
+                // Каждый паттерн из orderedPatterns есть в patterns, кроме только что удаленных
+                orderedPatterns.removeIf(pattern -> !patterns.containsKey(pattern.getId()));
+                rebuildSlots();
                 markDirty();
             }
         } finally {
@@ -208,9 +315,9 @@ public class LightPatternBuffer {
             
             gpuBuffer.clear();
             
+            // Сериализуем прямо в GPU буфер, без временного буфера на паттерн
             for (LightPattern1KB pattern : orderedPatterns) {
-                ByteBuffer patternBuffer = pattern.toByteBuffer();
-                gpuBuffer.put(patternBuffer);
+                pattern.writeTo(gpuBuffer);
             }
             
             gpuBuffer.flip();
@@ -228,12 +335,38 @@ public class LightPatternBuffer {
         try {
             patterns.clear();
             orderedPatterns.clear();
+            slotById.clear();
+            oldestIndex = 0;
             markDirty();
         } finally {
             lock.writeLock().unlock();
         }
     }
     
+    /**
+     * 🔁 Возврат списка к порядку вставки (самый старый - первый)
+     * 
+     * Вызывается под блокировкой записи перед операциями, которые
+     * удаляют элементы или меняют емкость.
+     */
+    private void restoreInsertionOrder() {
+        if (oldestIndex != 0) {
+            Collections.rotate(orderedPatterns, -oldestIndex);
+            oldestIndex = 0;
+            rebuildSlots();
+        }
+    }
+    
+    /**
+     * 🗂️ Пересчёт позиций после сдвига orderedPatterns (под блокировкой записи)
+     */
+    private void rebuildSlots() {
+        slotById.clear();
+        for (int i = 0; i < orderedPatterns.size(); i++) {
+            slotById.put(orderedPatterns.get(i).getId(), i);
+        }
+    }
+    
     /**
      * 🚩 Пометка буфера как измененного
      */
@@ -241,6 +374,7 @@ public class LightPatternBuffer {
         dirty = true;
         gpuBufferDirty = true;
         lastUpdateTime = System.currentTimeMillis();
+        version++;  // вызывается только под блокировкой записи
     }
     
     /**
@@ -257,6 +391,16 @@ public class LightPatternBuffer {
         dirty = false;
     }
     
+    /**
+     * 🔢 Версия содержимого буфера
+     * 
+     * В отличие от dirty, не сбрасывается при отрисовке: меняется только
+     * при добавлении, замене или удалении паттернов.
+     */
+    public long getVersion() {
+        return version;
+    }
+    
     /**
      * ⏰ Получение времени последнего обновления
      */
@@ -279,10 +423,17 @@ public class LightPatternBuffer {
         try {
             this.capacity = Math.max(MIN_CAPACITY, Math.min(MAX_CAPACITY, newCapacity));
             
-            // Обрезаем, если нужно
-            while (orderedPatterns.size() > capacity) {
-                LightPattern1KB removed = orderedPatterns.remove(0);
-                patterns.remove(removed.getId());
+            restoreInsertionOrder();
+            
+            // Обрезаем самые старые одним сдвигом, если нужно
+            int excess = orderedPatterns.size() - capacity;
+            if (excess > 0) {
+                List<LightPattern1KB> evicted = orderedPatterns.subList(0, excess);
+                for (LightPattern1KB removed : evicted) {
+                    patterns.remove(removed.getId());
+                }
+                evicted.clear();
+                rebuildSlots();
             }
             
             markDirty();
@@ -303,6 +454,46 @@ public class LightPatternBuffer {
         }
     }
     
+    /**
+     * 🔁 Обход всех паттернов без копирования списка
+     * 
+     * Выполняется под блокировкой чтения: action не должен
+     * добавлять или удалять паттерны в этом буфере.
+     */
+    public void forEachPattern(Consumer<LightPattern1KB> action) {
+        lock.readLock().lock();
+        try {
+            for (LightPattern1KB pattern : orderedPatterns) {
+                action.accept(pattern);
+            }
+        } finally {
+            lock.readLock().unlock();
+        }
+    }
+    
+    /**
+     * 🔎 Фильтр пачек при сливе очереди
+     * 
+     * Вызывается в клиентском потоке под блокировкой записи буфера.
+     */
+    @FunctionalInterface
+    public interface BatchFilter {
+        boolean accept(long chunkKey, List<LightPattern1KB> patterns);
+    }
+    
+    /**
+     * 📦 Пачка паттернов чанка, ожидающая слива
+     */
+    private static final class PendingBatch {
+        final long chunkKey;
+        final List<LightPattern1KB> patterns;
+        
+        PendingBatch(long chunkKey, List<LightPattern1KB> patterns) {
+            this.chunkKey = chunkKey;
+            this.patterns = patterns;
+        }
+    }
+    
     @Override
     public String toString() {
         return String.format("LightPatternBuffer[count=%d, capacity=%d, size=%.2f MB, dirty=%s]",
@@ -1,17 +1,22 @@
 package net.voxelcrai.pattern;
 
+import net.minecraft.block.Block;
 import net.minecraft.block.BlockState;
 import net.minecraft.util.math.BlockPos;
 import net.minecraft.util.math.Direction;
+import net.minecraft.world.World;
 import net.minecraft.world.chunk.WorldChunk;
 import net.voxelcrai.config.VoxelCraiConfig;
 import net.voxelcrai.mod.VoxelCraiMod;
 
 import java.util.ArrayList;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Set;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.ExecutorService;
 import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
 import java.util.function.Consumer;
 
 /**
@@ -36,8 +41,17 @@ public class PatternGenerator {
     // 🧵 Thread pool для асинхронной генерации
     private final ExecutorService executor;
     
-    // 📍 Отслеживание чанков
-    private final ConcurrentHashMap<Long, List<Long>> chunkPatternMap;
+    // 📍 Отслеживание чанков (ID паттернов хранятся примитивным массивом, без boxing)
+    private final ConcurrentHashMap<Long, long[]> chunkPatternMap;
+    
+    // 🌍 Загруженные чанки (только клиентский поток: события чанков и слив очереди)
+    private final Set<Long> loadedChunks;
+    
+    // 🎨 Материал по типу блока (классификация по имени считается один раз на блок)
+    private final ConcurrentHashMap<Block, MaterialProperties> materialCache;
+    
+    // 🛑 Максимальное ожидание завершения потоков при остановке
+    private static final long SHUTDOWN_TIMEOUT_MS = 1_000;
     
     // 🎲 ID генератор
     private long nextPatternId;
@@ -74,6 +88,12 @@ public class PatternGenerator {
     private final float[][] sampleDirections;
     private static final int SAMPLE_COUNT = 64;  // Количество сэмплов на точку
     
+    // 🔮 Значения SH базиса для каждого направления (предвычислены, [SAMPLE_COUNT][16])
+    private final float[][] sampleBasis;
+    
+    // 🧭 Направления соседей (Direction.values() клонирует массив при каждом вызове)
+    private static final Direction[] DIRECTIONS = Direction.values();
+    
     /**
      * 🏗️ Конструктор
      */
@@ -83,8 +103,11 @@ public class PatternGenerator {
             Math.max(2, Runtime.getRuntime().availableProcessors() / 2)
         );
         this.chunkPatternMap = new ConcurrentHashMap<>();
+        this.loadedChunks = new HashSet<>();
+        this.materialCache = new ConcurrentHashMap<>();
         this.nextPatternId = 1;
         this.sampleDirections = generateFibonacciSphere(SAMPLE_COUNT);
+        this.sampleBasis = computeSampleBasis(sampleDirections);
         
         VoxelCraiMod.LOGGER.info("🔮 PatternGenerator: {} sample directions", SAMPLE_COUNT);
     }
@@ -111,23 +134,22 @@ public class PatternGenerator {
         
         int chunkX = chunk.getPos().x;
         int chunkZ = chunk.getPos().z;
-        long chunkKey = getChunkKey(chunkX, chunkZ);
+        ChunkBounds bounds = new ChunkBounds(chunk);
         
         // 📍 Итерация по блокам чанка (с прореживанием для производительности)
         int step = config.getPatternDensity();  // 1 = каждый блок, 2 = каждый второй, и т.д.
+        int maxPatterns = config.getMaxPatternsPerChunk();
+        
+        // ⚡ Границы чанка не меняются внутри цикла — читаем их один раз
+        int startX = chunk.getPos().getStartX();
+        int startZ = chunk.getPos().getStartZ();
+        int maxY = chunk.getHighestNonEmptySectionYOffset() + 16;
+        int minY = chunk.getBottomY();
         
         for (int x = 0; x < 16; x += step) {
             for (int z = 0; z < 16; z += step) {
-                // Получаем высоту в этой точке
-                int maxY = chunk.getHighestNonEmptySectionYOffset() + 16;
-                int minY = chunk.getBottomY();
-                
                 for (int y = minY; y < maxY; y += step) {
-                    BlockPos pos = new BlockPos(
-                        chunk.getPos().getStartX() + x,
-                        y,
-                        chunk.getPos().getStartZ() + z
-                    );
+                    BlockPos pos = new BlockPos(startX + x, y, startZ + z);
                     
                     BlockState state = chunk.getBlockState(pos);
                     
@@ -136,34 +158,29 @@ public class PatternGenerator {
                     
                     // 🔮 Генерируем паттерн для непрозрачных/полупрозрачных блоков
                     if (!state.isTransparent()) {
-                        LightPattern1KB pattern = generatePatternForBlock(chunk, pos, state);
+                        LightPattern1KB pattern = generatePatternForBlock(chunk, bounds, pos, state);
                         patterns.add(pattern);
                         
                         // Ограничение количества паттернов на чанк
-                        if (patterns.size() >= config.getMaxPatternsPerChunk()) {
+                        if (patterns.size() >= maxPatterns) {
                             break;
                         }
                     }
                 }
                 
-                if (patterns.size() >= config.getMaxPatternsPerChunk()) {
+                if (patterns.size() >= maxPatterns) {
                     break;
                 }
             }
             
-            if (patterns.size() >= config.getMaxPatternsPerChunk()) {
+            if (patterns.size() >= maxPatterns) {
                 break;
             }
         }
         
-        // 📝 Сохраняем ID паттернов для этого чанка
-        List<Long> patternIds = new ArrayList<>();
-        for (LightPattern1KB pattern : patterns) {
-            patternIds.add(pattern.getId());
+        if (VoxelCraiMod.LOGGER.isDebugEnabled()) {
+            VoxelCraiMod.LOGGER.debug("✨ Чанк [{}, {}]: {} паттернов", chunkX, chunkZ, patterns.size());
         }
-        chunkPatternMap.put(chunkKey, patternIds);
-        
-        VoxelCraiMod.LOGGER.debug("✨ Чанк [{}, {}]: {} паттернов", chunkX, chunkZ, patterns.size());
         
         return patterns;
     }
@@ -171,29 +188,30 @@ public class PatternGenerator {
     /**
      * 💡 Генерация паттерна для отдельного блока
      */
-    private LightPattern1KB generatePatternForBlock(WorldChunk chunk, BlockPos pos, BlockState state) {
+    private LightPattern1KB generatePatternForBlock(WorldChunk chunk, ChunkBounds bounds, BlockPos pos, BlockState state) {
         LightPattern1KB pattern = new LightPattern1KB(nextPatternId++);
         
         // 📍 Позиция
         pattern.setPosition(pos.getX(), pos.getY(), pos.getZ());
         
-        // 🔮 Вычисляем SH коэффициенты
-        byte[] shCoeffs = computeShCoefficients(chunk, pos);
-        pattern.setShCoefficients4Bands(shCoeffs);
+        // 🔮 Вычисляем SH коэффициенты прямо в массив паттерна
+        computeShCoefficients(chunk, bounds, pos, pattern.getShCoefficients());
         
         // 💡 Прямое освещение (от неба/солнца)
         // В 1.21.3+ используем World для получения уровня освещения
+        // Мир читаем один раз на блок и передаём дальше
+        World world = chunk.getWorld();
         float skyLight = 0.8f;  // Default sky light
         float blockLight = 0.0f;
-        if (chunk.getWorld() != null) {
-            skyLight = chunk.getWorld().getLightLevel(net.minecraft.world.LightType.SKY, pos) / 15.0f;
-            blockLight = chunk.getWorld().getLightLevel(net.minecraft.world.LightType.BLOCK, pos) / 15.0f;
+        if (world != null) {
+            skyLight = world.getLightLevel(net.minecraft.world.LightType.SKY, pos) / 15.0f;
+            blockLight = world.getLightLevel(net.minecraft.world.LightType.BLOCK, pos) / 15.0f;
         }
         
         pattern.setDirectLight(skyLight, skyLight * 0.9f, skyLight * 0.8f);
         
         // 🌙 Непрямое освещение (bounce light аппроксимация)
-        float indirectStrength = computeIndirectLighting(chunk, pos);
+        float indirectStrength = computeIndirectLighting(world, bounds, pos);
         pattern.setIndirectLight(
             indirectStrength * 0.8f,
             indirectStrength * 0.85f,
@@ -206,7 +224,7 @@ public class PatternGenerator {
         pattern.setMetallic(mat.metallic);
         
         // ✨ AO, отражения
-        float ao = computeAmbientOcclusion(chunk, pos);
+        float ao = computeAmbientOcclusion(chunk, bounds, pos);
         pattern.setAmbientOcclusion(ao);
         pattern.setReflection(mat.metallic * (1.0f - mat.roughness));
         
@@ -225,20 +243,25 @@ public class PatternGenerator {
      * 1. Сэмплируем видимость в направлениях сферы
      * 2. Проецируем на SH базис
      * 3. Нормализуем в [-127, 127]
+     * 
+     * @param out массив SH коэффициентов паттерна, заполняются первые 16 (4 bands)
      */
-    private byte[] computeShCoefficients(WorldChunk chunk, BlockPos pos) {
-        byte[] coeffs = new byte[16];  // 4 bands
+    private void computeShCoefficients(WorldChunk chunk, ChunkBounds bounds, BlockPos pos, byte[] out) {
         float[] shValues = new float[16];
         
+        // Band 3 только для высокого качества
+        int coeffCount = config.getShBands() >= 4 ? 16 : 9;
+        
         // 🎯 Сэмплирование направлений
         for (int i = 0; i < SAMPLE_COUNT; i++) {
-            float[] dir = sampleDirections[i];
-            
             // Проверяем видимость в этом направлении
-            float visibility = traceVisibility(chunk, pos, dir);
+            float visibility = traceVisibility(chunk, bounds, pos, sampleDirections[i]);
             
-            // Проецируем на SH базис
-            projectToSH(dir, visibility, shValues);
+            // Проецируем на SH базис: накопление visibility * basis (gemv по направлениям)
+            float[] basis = sampleBasis[i];
+            for (int k = 0; k < coeffCount; k++) {
+                shValues[k] += visibility * basis[k];
+            }
         }
         
         // Нормализация и усреднение
@@ -247,67 +270,76 @@ public class PatternGenerator {
         for (int i = 0; i < 16; i++) {
             shValues[i] *= scale;
             // Конвертация в i8 [-127, 127]
-            coeffs[i] = (byte) Math.max(-127, Math.min(127, (int) (shValues[i] * 127.0f)));
+            out[i] = (byte) Math.max(-127, Math.min(127, (int) (shValues[i] * 127.0f)));
         }
-        
-        return coeffs;
     }
     
     /**
-     * 📐 Проекция направления на SH базисные функции
+     * 📐 Предвычисление SH базисных функций для фиксированных направлений сэмплирования
+     * 
+     * Направления не меняются после конструктора, поэтому полиномы базиса
+     * считаются один раз, а не для каждого блока и каждого луча.
      */
-    private void projectToSH(float[] dir, float value, float[] shValues) {
-        float x = dir[0];
-        float y = dir[1];
-        float z = dir[2];
-        
-        // Band 0
-        shValues[0] += value * 0.282095f;
-        
-        // Band 1
-        shValues[1] += value * 0.488603f * y;
-        shValues[2] += value * 0.488603f * z;
-        shValues[3] += value * 0.488603f * x;
-        
-        // Band 2
-        shValues[4] += value * 1.092548f * x * y;
-        shValues[5] += value * 1.092548f * y * z;
-        shValues[6] += value * 0.315392f * (3.0f * z * z - 1.0f);
-        shValues[7] += value * 1.092548f * x * z;
-        shValues[8] += value * 0.546274f * (x * x - y * y);
-        
-        // Band 3 (опционально, для высокого качества)
-        if (config.getShBands() >= 4) {
-            shValues[9] += value * 0.590044f * y * (3.0f * x * x - y * y);
-            shValues[10] += value * 2.890611f * x * y * z;
-            shValues[11] += value * 0.457046f * y * (4.0f * z * z - x * x - y * y);
-            shValues[12] += value * 0.373176f * z * (2.0f * z * z - 3.0f * x * x - 3.0f * y * y);
-            shValues[13] += value * 0.457046f * x * (4.0f * z * z - x * x - y * y);
-            shValues[14] += value * 2.890611f * z * (x * x - y * y);
-            shValues[15] += value * 0.590044f * x * (x * x - 3.0f * y * y);
+    private static float[][] computeSampleBasis(float[][] directions) {
+        float[][] table = new float[directions.length][16];
+        
+        for (int i = 0; i < directions.length; i++) {
+            float x = directions[i][0];
+            float y = directions[i][1];
+            float z = directions[i][2];
+            float[] b = table[i];
+            
+            // Band 0
+            b[0] = SH_CONSTANTS[0];
+            
+            // Band 1
+            b[1] = SH_CONSTANTS[1] * y;
+            b[2] = SH_CONSTANTS[2] * z;
+            b[3] = SH_CONSTANTS[3] * x;
+            
+            // Band 2
+            b[4] = SH_CONSTANTS[4] * x * y;
+            b[5] = SH_CONSTANTS[5] * y * z;
+            b[6] = SH_CONSTANTS[6] * (3.0f * z * z - 1.0f);
+            b[7] = SH_CONSTANTS[7] * x * z;
+            b[8] = SH_CONSTANTS[8] * (x * x - y * y);
+            
+            // Band 3
+            b[9] = SH_CONSTANTS[9] * y * (3.0f * x * x - y * y);
+            b[10] = SH_CONSTANTS[10] * x * y * z;
+            b[11] = SH_CONSTANTS[11] * y * (4.0f * z * z - x * x - y * y);
+            b[12] = SH_CONSTANTS[12] * z * (2.0f * z * z - 3.0f * x * x - 3.0f * y * y);
+            b[13] = SH_CONSTANTS[13] * x * (4.0f * z * z - x * x - y * y);
+            b[14] = SH_CONSTANTS[14] * z * (x * x - y * y);
+            b[15] = SH_CONSTANTS[15] * x * (x * x - 3.0f * y * y);
         }
+        
+        return table;
     }
     
     /**
      * 👁️ Трассировка видимости в направлении
      */
-    private float traceVisibility(WorldChunk chunk, BlockPos origin, float[] direction) {
+    private float traceVisibility(WorldChunk chunk, ChunkBounds bounds, BlockPos origin, float[] direction) {
         int maxDistance = 8;  // Максимальная дистанция трассировки
         
         float visibility = 1.0f;
         
+        // Одна изменяемая позиция на весь луч вместо new BlockPos на каждом шаге
+        BlockPos.Mutable checkPos = new BlockPos.Mutable();
+        
         for (int step = 1; step <= maxDistance; step++) {
             int x = origin.getX() + Math.round(direction[0] * step);
             int y = origin.getY() + Math.round(direction[1] * step);
             int z = origin.getZ() + Math.round(direction[2] * step);
             
-            BlockPos checkPos = new BlockPos(x, y, z);
-            
             // Проверяем только в пределах чанка для производительности
-            if (!isInChunk(chunk, checkPos)) {
+            if (!bounds.contains(x, y, z)) {
                 break;
             }
             
+            checkPos.set(x, y, z);
+            
             BlockState state = chunk.getBlockState(checkPos);
             
             if (!state.isAir()) {
@@ -325,17 +357,22 @@ public class PatternGenerator {
     /**
      * 🌙 Вычисление непрямого освещения
      */
-    private float computeIndirectLighting(WorldChunk chunk, BlockPos pos) {
+    private float computeIndirectLighting(World world, ChunkBounds bounds, BlockPos pos) {
+        if (world == null) {
+            return 0.0f;
+        }
+        
         float totalLight = 0.0f;
         int samples = 0;
+        BlockPos.Mutable neighbor = new BlockPos.Mutable();
         
         // Сэмплируем соседние блоки
-        for (Direction dir : Direction.values()) {
-            BlockPos neighbor = pos.offset(dir);
+        for (Direction dir : DIRECTIONS) {
+            neighbor.set(pos, dir);
             
-            if (isInChunk(chunk, neighbor) && chunk.getWorld() != null) {
-                float skyLight = chunk.getWorld().getLightLevel(net.minecraft.world.LightType.SKY, neighbor) / 15.0f;
-                float blockLight = chunk.getWorld().getLightLevel(net.minecraft.world.LightType.BLOCK, neighbor) / 15.0f;
+            if (bounds.contains(neighbor)) {
+                float skyLight = world.getLightLevel(net.minecraft.world.LightType.SKY, neighbor) / 15.0f;
+                float blockLight = world.getLightLevel(net.minecraft.world.LightType.BLOCK, neighbor) / 15.0f;
                 totalLight += Math.max(skyLight, blockLight);
                 samples++;
             }
@@ -347,9 +384,10 @@ public class PatternGenerator {
     /**
      * 🌑 Вычисление Ambient Occlusion
      */
-    private float computeAmbientOcclusion(WorldChunk chunk, BlockPos pos) {
+    private float computeAmbientOcclusion(WorldChunk chunk, ChunkBounds bounds, BlockPos pos) {
         int occluded = 0;
         int total = 0;
+        BlockPos.Mutable neighbor = new BlockPos.Mutable();
         
         // Проверяем окклюзию в 26 соседних позициях (3x3x3 куб)
         for (int dx = -1; dx <= 1; dx++) {
@@ -357,10 +395,10 @@ public class PatternGenerator {
                 for (int dz = -1; dz <= 1; dz++) {
                     if (dx == 0 && dy == 0 && dz == 0) continue;
                     
-                    BlockPos neighbor = pos.add(dx, dy, dz);
+                    neighbor.set(pos, dx, dy, dz);
                     total++;
                     
-                    if (isInChunk(chunk, neighbor)) {
+                    if (bounds.contains(neighbor)) {
                         BlockState state = chunk.getBlockState(neighbor);
                         if (!state.isAir() && !state.isTransparent()) {
                             occluded++;
@@ -378,7 +416,14 @@ public class PatternGenerator {
      * 🎨 Получение материала для блока
      */
     private MaterialProperties getMaterialForBlock(BlockState state) {
-        String blockName = state.getBlock().getTranslationKey();
+        return materialCache.computeIfAbsent(state.getBlock(), PatternGenerator::classifyMaterial);
+    }
+    
+    /**
+     * 🎨 Классификация материала по ключу перевода блока
+     */
+    private static MaterialProperties classifyMaterial(Block block) {
+        String blockName = block.getTranslationKey();
         
         // 🪨 Камень, земля
         if (blockName.contains("stone") || blockName.contains("dirt") || blockName.contains("grass")) {
@@ -428,47 +473,92 @@ public class PatternGenerator {
         // 🌧️ Модификатор погоды
         float weatherMod = 1.0f - rainGradient * 0.5f;
         
-        // Обновляем все паттерны
-        for (LightPattern1KB pattern : buffer.getAllPatterns()) {
-            // Модифицируем SH коэффициенты на основе времени
+        // Band 0 (ambient) зависит от солнца
+        float ambientMod = 0.2f + sunIntensity * 0.8f * weatherMod;
+        
+        // Band 1 (направленный свет) зависит от позиции солнца
+        float sunAngle = timeOfDay * 2 * (float) Math.PI;
+        int sunYOffset = (int) ((float) Math.sin(sunAngle) * 50 * weatherMod);
+        int sunXOffset = (int) ((float) Math.cos(sunAngle) * 50 * weatherMod);
+        
+        // Обновляем все паттерны (модификаторы одинаковы для всех, считаются один раз)
+        // Обход на месте под блокировкой чтения, без копии списка из 10k+ паттернов
+        buffer.forEachPattern(pattern -> {
+            // Модифицируем SH коэффициенты на основе времени, всегда от исходных
+            // значений: повторный вызов с теми же входами дает тот же результат
+            byte[] base = pattern.getBaseShCoefficients();
             byte[] coeffs = pattern.getShCoefficients();
             
-            // Band 0 (ambient) зависит от солнца
-            float ambientMod = 0.2f + sunIntensity * 0.8f * weatherMod;
-            coeffs[0] = (byte) Math.max(-127, Math.min(127, coeffs[0] * ambientMod));
-            
-            // Band 1 (направленный свет) зависит от позиции солнца
-            float sunAngle = timeOfDay * 2 * (float) Math.PI;
-            float sunX = (float) Math.cos(sunAngle);
-            float sunY = (float) Math.sin(sunAngle);
-            
-            coeffs[1] = (byte) Math.max(-127, Math.min(127, coeffs[1] + (int)(sunY * 50 * weatherMod)));
-            coeffs[3] = (byte) Math.max(-127, Math.min(127, coeffs[3] + (int)(sunX * 50 * weatherMod)));
-        }
+            coeffs[0] = (byte) Math.max(-127, Math.min(127, base[0] * ambientMod));
+            coeffs[1] = (byte) Math.max(-127, Math.min(127, base[1] + sunYOffset));
+            coeffs[3] = (byte) Math.max(-127, Math.min(127, base[3] + sunXOffset));
+        });
         
         buffer.clearDirty();  // Помечаем как обновленный
     }
     
+    /**
+     * 🌍 Чанк загружен (клиентский поток)
+     */
+    public void onChunkLoaded(int chunkX, int chunkZ) {
+        loadedChunks.add(getChunkKey(chunkX, chunkZ));
+    }
+    
+    /**
+     * 📝 Привязка готовой пачки к чанку при сливе очереди (клиентский поток)
+     * 
+     * Пачка чанка, выгруженного после постановки в очередь, отклоняется:
+     * иначе её паттерны остались бы в буфере без владельца. Паттерны
+     * предыдущей генерации того же чанка заменяются новыми.
+     * 
+     * @return true, если пачку нужно применить
+     */
+    public boolean acceptChunkBatch(long chunkKey, List<LightPattern1KB> patterns) {
+        if (!loadedChunks.contains(chunkKey)) {
+            return false;
+        }
+        
+        long[] patternIds = new long[patterns.size()];
+        for (int i = 0; i < patternIds.length; i++) {
+            patternIds[i] = patterns.get(i).getId();
+        }
+        
+        long[] previousIds = chunkPatternMap.put(chunkKey, patternIds);
+        if (previousIds != null) {
+            VoxelCraiMod.getInstance().getPatternBuffer().removePatterns(previousIds);
+        }
+        return true;
+    }
+    
     /**
      * 🗑️ Освобождение паттернов чанка
      */
     public void releaseChunk(int chunkX, int chunkZ) {
         long chunkKey = getChunkKey(chunkX, chunkZ);
-        List<Long> patternIds = chunkPatternMap.remove(chunkKey);
+        loadedChunks.remove(chunkKey);
+        long[] patternIds = chunkPatternMap.remove(chunkKey);
         
         if (patternIds != null) {
-            LightPatternBuffer buffer = VoxelCraiMod.getInstance().getPatternBuffer();
-            for (Long id : patternIds) {
-                buffer.removePattern(id);
-            }
+            VoxelCraiMod.getInstance().getPatternBuffer().removePatterns(patternIds);
         }
     }
     
     /**
      * 🛑 Остановка генератора
+     * 
+     * Отменяет ожидающие задачи и дожидается завершения текущих,
+     * чтобы потоки пула не держали JVM при выходе из игры.
      */
     public void shutdown() {
-        executor.shutdown();
+        executor.shutdownNow();
+        
+        try {
+            if (!executor.awaitTermination(SHUTDOWN_TIMEOUT_MS, TimeUnit.MILLISECONDS)) {
+                VoxelCraiMod.LOGGER.warn("⚠️ PatternGenerator: потоки не завершились за {} мс", SHUTDOWN_TIMEOUT_MS);
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
     }
     
     // ========== 🔧 Вспомогательные методы ==========
@@ -476,22 +566,10 @@ public class PatternGenerator {
     /**
      * 🔑 Получение ключа чанка
      */
-    private long getChunkKey(int chunkX, int chunkZ) {
+    public static long getChunkKey(int chunkX, int chunkZ) {
         return ((long) chunkX << 32) | (chunkZ & 0xFFFFFFFFL);
     }
     
-    /**
-     * 📍 Проверка, находится ли позиция в чанке
-     */
-    private boolean isInChunk(WorldChunk chunk, BlockPos pos) {
-        int startX = chunk.getPos().getStartX();
-        int startZ = chunk.getPos().getStartZ();
-        
-        return pos.getX() >= startX && pos.getX() < startX + 16 &&
-               pos.getZ() >= startZ && pos.getZ() < startZ + 16 &&
-               pos.getY() >= chunk.getBottomY() && pos.getY() < chunk.getTopYInclusive();
-    }
-    
     /**
      * 🌐 Генерация точек на сфере (фибоначчиево распределение)
      */
@@ -512,6 +590,38 @@ public class PatternGenerator {
         return points;
     }
     
+    /**
+     * 📍 Границы чанка, вычисляемые один раз на чанк
+     * (проверка попадания в чанк вызывается на каждом шаге трассировки и для каждого соседа)
+     */
+    private static final class ChunkBounds {
+        final int minX;
+        final int maxX;  // исключительно
+        final int minY;
+        final int maxY;  // исключительно
+        final int minZ;
+        final int maxZ;  // исключительно
+        
+        ChunkBounds(WorldChunk chunk) {
+            this.minX = chunk.getPos().getStartX();
+            this.maxX = minX + 16;
+            this.minY = chunk.getBottomY();
+            this.maxY = chunk.getTopYInclusive();
+            this.minZ = chunk.getPos().getStartZ();
+            this.maxZ = minZ + 16;
+        }
+        
+        boolean contains(int x, int y, int z) {
+            return x >= minX && x < maxX &&
+                   z >= minZ && z < maxZ &&
+                   y >= minY && y < maxY;
+        }
+        
+        boolean contains(BlockPos pos) {
+            return contains(pos.getX(), pos.getY(), pos.getZ());
+        }
+    }
+    
     /**
      * 🎨 Класс для свойств материала
      */
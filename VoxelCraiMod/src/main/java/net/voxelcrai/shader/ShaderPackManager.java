@@ -37,6 +37,9 @@ public class ShaderPackManager implements SimpleSynchronousResourceReloadListene
     private Path shaderPackPath;
     private boolean initialized;
     
+    // 🔑 Значения конфига, из которых сгенерирован текущий шейдер-пак
+    private String generatedFingerprint;
+    
     /**
      * 🏗️ Конструктор
      */
@@ -54,6 +57,13 @@ public class ShaderPackManager implements SimpleSynchronousResourceReloadListene
     public void reload(ResourceManager manager) {
         VoxelCraiMod.LOGGER.info("🎭 Перезагрузка шейдер-пака...");
         
+        // ♻️ Пак зависит только от конфига - при неизменном конфиге не пересобираем
+        if (initialized && getConfigFingerprint().equals(generatedFingerprint)
+                && shaderPackPath != null && Files.exists(shaderPackPath)) {
+            VoxelCraiMod.LOGGER.info("✅ Шейдер-пак актуален, генерация пропущена: {}", shaderPackPath);
+            return;
+        }
+        
         try {
             generateShaderPack();
             initialized = true;
@@ -67,6 +77,8 @@ public class ShaderPackManager implements SimpleSynchronousResourceReloadListene
      * 📦 Генерация шейдер-пака
      */
     public void generateShaderPack() throws IOException {
+        String fingerprint = getConfigFingerprint();
+        
         // Путь к папке shaderpacks в .minecraft
         Path minecraftDir = net.fabricmc.loader.api.FabricLoader.getInstance()
             .getGameDir();
@@ -102,6 +114,17 @@ public class ShaderPackManager implements SimpleSynchronousResourceReloadListene
             
             VoxelCraiMod.LOGGER.info("✅ Шейдер-пак создан успешно");
         }
+        
+        generatedFingerprint = fingerprint;
+    }
+    
+    /**
+     * 🔑 Отпечаток значений конфига, которые попадают в сгенерированные шейдеры
+     */
+    private String getConfigFingerprint() {
+        return config.getShBands() + ":" + config.getGiIntensity() + ":" 
+            + config.getShadowIntensity() + ":" + config.getReflectionIntensity() + ":" 
+            + config.getPatternCount();
     }
     
     /**
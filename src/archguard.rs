@@ -23,8 +23,8 @@ pub struct ArchGuard {
     // Rhythm detector (0.038 Hz = ~26.3 seconds period)
     rhythm_detector: RhythmDetector,
     
-    // Empathy ratio
-    empathy_ratio_value: Arc<RwLock<f64>>,
+    // Empathy ratio (f64 bits, read without locking)
+    empathy_ratio_value: Arc<AtomicU64>,
 }
 
 impl ArchGuard {
@@ -70,7 +70,7 @@ impl ArchGuard {
             latency_histogram,
             empathy_ratio,
             rhythm_detector: RhythmDetector::new(0.038), // 0.038 Hz
-            empathy_ratio_value: Arc::new(RwLock::new(0.5)),
+            empathy_ratio_value: Arc::new(AtomicU64::new(0.5f64.to_bits())),
         }
     }
     
@@ -136,16 +136,18 @@ impl ArchGuard {
     /// Update empathy ratio (0.0 - 1.0)
     pub async fn update_empathy_ratio(&self, ratio: f64) {
         let clamped = ratio.max(0.0).min(1.0);
-        {
-            let mut value = self.empathy_ratio_value.write().await;
-            *value = clamped;
-        }
+        self.empathy_ratio_value.store(clamped.to_bits(), Ordering::Release);
         self.empathy_ratio.set(clamped);
     }
     
     /// Get current empathy ratio
     pub async fn get_empathy_ratio(&self) -> f64 {
-        *self.empathy_ratio_value.read().await
+        self.empathy_ratio()
+    }
+    
+    /// Current empathy ratio, read without awaiting (for per-frame readers)
+    pub fn empathy_ratio(&self) -> f64 {
+        f64::from_bits(self.empathy_ratio_value.load(Ordering::Acquire))
     }
     
     /// Check if circuit breaker is open
@@ -179,7 +181,7 @@ impl Default for ArchGuard {
 struct RhythmDetector {
     frequency: f64, // 0.038 Hz
     period: f64,    // 1 / frequency
-    last_update: f64,
+    origin: Option<f64>,
     phase: f64,
 }
 
@@ -188,17 +190,17 @@ impl RhythmDetector {
         Self {
             frequency,
             period: 1.0 / frequency,
-            last_update: 0.0,
+            origin: None,
             phase: 0.0,
         }
     }
     
     fn update(&mut self, timestamp: f64) {
-        if self.last_update > 0.0 {
-            let delta = timestamp - self.last_update;
-            self.phase = (self.phase + delta / self.period) % 1.0;
-        }
-        self.last_update = timestamp;
+        // Phase is derived from the absolute time since the first sample
+        // rather than accumulated per update, so it cannot drift with
+        // irregular tick spacing or rounding of many small deltas
+        let origin = *self.origin.get_or_insert(timestamp);
+        self.phase = ((timestamp - origin) / self.period).rem_euclid(1.0);
     }
     
     fn get_phase(&self) -> f64 {
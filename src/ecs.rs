@@ -9,18 +9,17 @@ pub mod systems {
     /// System to update voxel physics
     pub fn update_voxel_physics(mut query: Query<&mut Voxel>) {
         for mut voxel in query.iter_mut() {
-            // Update position based on velocity
-            voxel.position[0] += voxel.velocity_x as i32;
-            voxel.position[1] += voxel.velocity_y as i32;
-            voxel.position[2] += voxel.velocity_z as i32;
+            // Semi-implicit (symplectic) Euler: velocity is advanced first and the
+            // position uses the new velocity, so acceleration takes effect on the
+            // same tick and the step stays stable under constant forces
             
-            // Update velocity based on acceleration
-            voxel.velocity_x = (voxel.velocity_x as i16 + voxel.acceleration_x as i16)
-                .max(-128).min(127) as i8;
-            voxel.velocity_y = (voxel.velocity_y as i16 + voxel.acceleration_y as i16)
-                .max(-128).min(127) as i8;
-            voxel.velocity_z = (voxel.velocity_z as i16 + voxel.acceleration_z as i16)
-                .max(-128).min(127) as i8;
+            // Update velocity based on acceleration (clamped to the i8 range)
+            voxel.velocity_x = voxel.velocity_x.saturating_add(voxel.acceleration_x);
+            voxel.velocity_y = voxel.velocity_y.saturating_add(voxel.acceleration_y);
+            voxel.velocity_z = voxel.velocity_z.saturating_add(voxel.acceleration_z);
+            
+            // Update position based on the new velocity
+            voxel.integrate_position();
         }
     }
     
@@ -21,30 +21,54 @@ impl EvolutionEngine {
     
     /// Combine two genomes (crossover)
     pub fn combine(&self, parent1: &Genome, parent2: &Genome) -> Genome {
-        let mut rng = rand::thread_rng();
         let mut child = Genome::new();
+        self.combine_into(&mut rand::thread_rng(), parent1, parent2, &mut child);
+        child
+    }
+    
+    /// Crossover into an existing genome, drawing from the caller's RNG.
+    /// The child's concept Vec and String buffers are overwritten in place,
+    /// so `evolve` can recycle replaced genomes instead of allocating new ones
+    fn combine_into<R: Rng + ?Sized>(
+        &self,
+        rng: &mut R,
+        parent1: &Genome,
+        parent2: &Genome,
+        child: &mut Genome,
+    ) {
+        // A recycled child still carries the old genome's limit; a crossover
+        // child always starts from the default, as a fresh Genome would
+        child.max_concepts = Genome::DEFAULT_MAX_CONCEPTS;
         
-        // Combine concepts from both parents
-        let all_concepts: Vec<String> = parent1.concepts.iter()
-            .chain(parent2.concepts.iter())
-            .cloned()
-            .collect();
+        // Concepts from both parents, indexed as one chained list
+        let len1 = parent1.concepts.len();
+        let total = len1 + parent2.concepts.len();
         
         // Randomly select concepts for child
-        let num_concepts = (all_concepts.len() / 2).min(child.max_concepts);
-        for _ in 0..num_concepts {
-            if let Some(concept) = all_concepts.get(rng.gen_range(0..all_concepts.len())) {
-                child.add_concept(concept.clone());
+        let num_concepts = (total / 2).min(child.max_concepts);
+        for slot in 0..num_concepts {
+            let pick = rng.gen_range(0..total);
+            let concept = if pick < len1 {
+                &parent1.concepts[pick]
+            } else {
+                &parent2.concepts[pick - len1]
+            };
+            
+            match child.concepts.get_mut(slot) {
+                Some(existing) => existing.clone_from(concept),
+                None => child.concepts.push(concept.clone()),
             }
         }
-        
-        child
+        child.concepts.truncate(num_concepts);
     }
     
     /// Mutate genome
     pub fn mutate(&self, genome: &mut Genome) {
-        let mut rng = rand::thread_rng();
-        
+        self.mutate_with(&mut rand::thread_rng(), genome)
+    }
+    
+    /// Mutation drawing from the caller's RNG
+    fn mutate_with<R: Rng + ?Sized>(&self, rng: &mut R, genome: &mut Genome) {
         if rng.gen_bool(self.mutation_rate) {
             // Add random concept
             if genome.concepts.len() < genome.max_concepts {
@@ -106,13 +130,20 @@ impl EvolutionEngine {
             .map(|(i, v)| (i, self.fitness(v)))
             .collect();
         
-        // Sort by fitness
-        fitness_scores.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap());
-        
-        // Select top performers
+        // Select top performers: only the top half has to be partitioned out,
+        // parents are drawn from it at random, so a full sort is not needed
         let top_count = (voxels.len() / 2).max(1);
+        if top_count < fitness_scores.len() {
+            fitness_scores.select_nth_unstable_by(top_count - 1, |a, b| {
+                b.1.partial_cmp(&a.1).unwrap()
+            });
+        }
         let mut rng = rand::thread_rng();
         
+        // Scratch genome: each child is built here and swapped in, and the
+        // replaced genome becomes the next scratch, so buffers are recycled
+        let mut scratch = Genome::new();
+        
         // Create new generation
         for i in top_count..voxels.len() {
             let parent1_idx = fitness_scores[rng.gen_range(0..top_count)].0;
@@ -120,17 +151,20 @@ impl EvolutionEngine {
             
             if rng.gen_bool(self.crossover_rate) {
                 // Crossover
-                let mut new_genome = self.combine(
+                self.combine_into(
+                    &mut rng,
                     &voxels[parent1_idx].genome,
                     &voxels[parent2_idx].genome,
+                    &mut scratch,
                 );
-                self.mutate(&mut new_genome);
-                voxels[i].genome = new_genome;
             } else {
                 // Mutation only
-                voxels[i].genome = voxels[parent1_idx].genome.clone();
-                self.mutate(&mut voxels[i].genome);
+                let parent = &voxels[parent1_idx].genome;
+                scratch.concepts.clone_from(&parent.concepts);
+                scratch.max_concepts = parent.max_concepts;
             }
+            self.mutate_with(&mut rng, &mut scratch);
+            std::mem::swap(&mut voxels[i].genome, &mut scratch);
         }
     }
 }
@@ -115,11 +115,14 @@ impl LightingSystem {
     }
     
     pub fn update_lighting(&mut self, time: f32) {
+        // Oscillate direct light: the value depends only on time, so it is
+        // computed and converted to f16 once and then broadcast to all patterns
+        let oscillation = (time * 0.5).sin() * 0.5 + 0.5;
+        let direct_light = f16::from_f32(oscillation);
+        
         // Animate lighting patterns
         for pattern in &mut self.patterns {
-            // Oscillate direct light
-            let oscillation = (time * 0.5).sin() * 0.5 + 0.5;
-            pattern.direct_light = f16::from_f32(oscillation);
+            pattern.direct_light = direct_light;
         }
     }
 }
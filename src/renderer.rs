@@ -2,6 +2,26 @@ use wgpu::util::DeviceExt;
 use wgpu::*;
 use winit::window::Window;
 
+/// GPU vertex layout of one point: matches `point_cloud.wgsl` inputs,
+/// so a slice of these is uploaded with a single byte cast.
+/// Color is stored as Unorm8x4 (16 bytes per vertex instead of 24)
+#[repr(C)]
+#[derive(Clone, Copy, bytemuck::Pod, bytemuck::Zeroable)]
+struct PointVertex {
+    position: [f32; 3],
+    color: [u8; 4],
+}
+
+impl PointVertex {
+    fn new(position: [f32; 3], color: [f32; 3]) -> Self {
+        let unorm = |c: f32| (c.clamp(0.0, 1.0) * 255.0 + 0.5) as u8;
+        Self {
+            position,
+            color: [unorm(color[0]), unorm(color[1]), unorm(color[2]), 255],
+        }
+    }
+}
+
 pub struct Renderer {
     surface: Surface<'static>,
     device: Device,
@@ -10,6 +30,8 @@ pub struct Renderer {
     render_pipeline: RenderPipeline,
     point_buffer: Option<Buffer>,
     num_points: usize,
+    // CPU-side staging for vertex upload, reused across frames
+    vertex_scratch: Vec<PointVertex>,
     // HIP/ROCm fallback for AMD Vega 20 (would need rocm-smi integration)
     use_hip_fallback: bool,
 }
@@ -86,7 +108,7 @@ impl Renderer {
                 module: &shader,
                 entry_point: Some("vs_main"),
                 buffers: &[VertexBufferLayout {
-                    array_stride: 24, // 3 f32 position + 3 f32 color
+                    array_stride: std::mem::size_of::<PointVertex>() as BufferAddress,
                     step_mode: VertexStepMode::Vertex,
                     attributes: &[
                         VertexAttribute {
@@ -97,7 +119,7 @@ impl Renderer {
                         VertexAttribute {
                             offset: 12,
                             shader_location: 1,
-                            format: VertexFormat::Float32x3,
+                            format: VertexFormat::Unorm8x4,
                         },
                     ],
                 }],
@@ -137,11 +159,17 @@ impl Renderer {
             render_pipeline,
             point_buffer: None,
             num_points: 0,
+            vertex_scratch: Vec::new(),
             use_hip_fallback,
         })
     }
     
     pub fn resize(&mut self, width: u32, height: u32) {
+        // Reconfiguring recreates the swapchain; skip it when nothing changed
+        if width == self.config.width && height == self.config.height {
+            return;
+        }
+        
         if width > 0 && height > 0 {
             self.config.width = width;
             self.config.height = height;
@@ -154,20 +182,29 @@ impl Renderer {
             return;
         }
         
-        // Flatten point data
-        let mut data = Vec::with_capacity(points.len() * 6);
-        for (pos, color) in points {
-            data.extend_from_slice(pos);
-            data.extend_from_slice(color);
-        }
+        // One fixed-layout vertex per point, uploaded as raw bytes
+        self.vertex_scratch.clear();
+        self.vertex_scratch.extend(
+            points.iter().map(|&(position, color)| PointVertex::new(position, color)),
+        );
+        let bytes: &[u8] = bytemuck::cast_slice(&self.vertex_scratch);
         
-        let buffer = self.device.create_buffer_init(&wgpu::util::BufferInitDescriptor {
-            label: Some("Point Cloud Buffer"),
-            contents: bytemuck::cast_slice(&data),
-            usage: BufferUsages::VERTEX,
-        });
+        // Overwrite the existing GPU buffer when it is large enough;
+        // only allocate a new one when the point cloud outgrows it
+        match self.point_buffer {
+            Some(ref buffer) if buffer.size() >= bytes.len() as BufferAddress => {
+                self.queue.write_buffer(buffer, 0, bytes);
+            }
+            _ => {
+                let buffer = self.device.create_buffer_init(&wgpu::util::BufferInitDescriptor {
+                    label: Some("Point Cloud Buffer"),
+                    contents: bytes,
+                    usage: BufferUsages::VERTEX | BufferUsages::COPY_DST,
+                });
+                self.point_buffer = Some(buffer);
+            }
+        }
         
-        self.point_buffer = Some(buffer);
         self.num_points = points.len();
     }
     
@@ -59,7 +59,7 @@ fn main() {
     let mut world = VoxelWorld::new();
     world.add_voxel([10, 20, 30]);
     world.add_voxel([15, 25, 35]);
-    println!("  ✓ VoxelWorld created with {} voxels", world.voxels.len());
+    println!("  ✓ VoxelWorld created with {} voxels", world.voxels().len());
     println!("  ✓ Max points: {}", world.max_points);
     
     // Test trauma mode
@@ -88,7 +88,12 @@ fn main() {
     println!("  ✓ Rhythm phase (0.038 Hz): {:.3}", phase);
     
     // Test empathy ratio
-    let rt = tokio::runtime::Runtime::new().unwrap();
+    // A single-threaded runtime is enough to drive these awaits; the default
+    // multi-threaded runtime would spawn a worker per core just for this
+    let rt = tokio::runtime::Builder::new_current_thread()
+        .enable_all()
+        .build()
+        .unwrap();
     rt.block_on(async {
         archguard.update_empathy_ratio(0.75).await;
         let empathy = archguard.get_empathy_ratio().await;
@@ -3,7 +3,6 @@ use crate::evolution::EvolutionEngine;
 use crate::lighting::LightingSystem;
 use crate::voxel::VoxelWorld;
 use eframe::egui;
-use std::sync::atomic::Ordering;
 use std::time::Instant;
 
 pub struct EngineUI {
@@ -47,8 +46,8 @@ impl eframe::App for EngineUI {
         // Update rhythm detector
         self.archguard.update_rhythm(elapsed);
         
-        // Get point cloud data
-        self.point_cloud_data = self.world.get_point_cloud_data();
+        // Get point cloud data (refills the same buffer every frame)
+        self.world.fill_point_cloud_data(&mut self.point_cloud_data);
         
         // UI
         egui::CentralPanel::default().show(ctx, |ui| {
@@ -62,7 +61,7 @@ impl eframe::App for EngineUI {
             ui.separator();
             
             // Stats
-            ui.label(format!("Voxels: {}", self.world.voxels.len()));
+            ui.label(format!("Voxels: {}", self.world.voxels().len()));
             ui.label(format!("Points: {}", self.point_cloud_data.len()));
             ui.label(format!("FPS: {:.1}", 1.0 / delta_time));
             ui.label(format!("Time: {:.2}s", elapsed));
@@ -70,10 +69,9 @@ impl eframe::App for EngineUI {
             // ArchGuard stats
             ui.separator();
             ui.heading("ArchGuard Enterprise");
-            ui.label(format!("Circuit Open: {}", 
-                self.archguard.circuit_open.load(Ordering::Acquire)));
+            ui.label(format!("Circuit Open: {}", self.archguard.is_circuit_open()));
             
-            let empathy = pollster::block_on(self.archguard.get_empathy_ratio());
+            let empathy = self.archguard.empathy_ratio();
             ui.label(format!("Empathy Ratio: {:.3}", empathy));
             
             let rhythm_phase = self.archguard.get_rhythm_phase();
@@ -111,19 +109,28 @@ impl eframe::App for EngineUI {
                     egui::Sense::hover()
                 );
                 
-                let painter = ui.painter();
-                for (pos, color) in self.point_cloud_data.iter().take(max_points_display) {
-                    // Simple 2D projection
-                    let x = rect.min.x + (pos[0] * 100.0 + 400.0);
-                    let y = rect.min.y + (pos[1] * 100.0 + 300.0);
-                    let point = egui::Pos2::new(x, y);
+                // Simple 2D projection: scale plus a per-frame origin, folded once
+                // so each point costs one multiply-add per axis
+                const SCALE: f32 = 100.0;
+                let origin = rect.min + egui::Vec2::new(400.0, 300.0);
+                
+                // All points go to the painter as one batch: a single extend of
+                // the shape list instead of one add (and one layer lookup) per point.
+                // Points projected outside the canvas are culled before any color
+                // or shape is built for them
+                let points = self.point_cloud_data.iter().take(max_points_display).filter_map(|(pos, color)| {
+                    let point = egui::Pos2::new(origin.x + pos[0] * SCALE, origin.y + pos[1] * SCALE);
+                    if !rect.contains(point) {
+                        return None;
+                    }
                     let egui_color = egui::Color32::from_rgb(
                         (color[0] * 255.0) as u8,
                         (color[1] * 255.0) as u8,
                         (color[2] * 255.0) as u8,
                     );
-                    painter.circle_filled(point, 1.0, egui_color);
-                }
+                    Some(egui::Shape::circle_filled(point, 1.0, egui_color))
+                });
+                ui.painter().extend(points);
             }
             
             // Debug info
@@ -133,7 +140,7 @@ impl eframe::App for EngineUI {
                 ui.label("Renderer: wgpu (Vulkan) via eframe");
                 ui.label(format!("Max Points: {}", self.world.max_points));
                 ui.label(format!("Voxel Size: ~{} bytes", 
-                    if !self.world.voxels.is_empty() {
+                    if !self.world.voxels().is_empty() {
                         // Estimate
                         "9-13 KB"
                     } else {
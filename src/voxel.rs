@@ -106,11 +106,24 @@ impl Voxel {
     }
     
     pub fn get_energy_color(&self, max_energy: f64) -> [f32; 3] {
-        let normalized = (self.energy / max_energy.max(1.0)).min(1.0) as f32;
-        // Yellow = max energy (1.0, 1.0, 0.0)
-        // Interpolate from black to yellow
-        [normalized, normalized, 0.0]
+        energy_color(self.energy, max_energy)
     }
+    
+    /// Advance position by one tick of the current velocity
+    #[inline]
+    pub fn integrate_position(&mut self) {
+        self.position[0] += self.velocity_x as i32;
+        self.position[1] += self.velocity_y as i32;
+        self.position[2] += self.velocity_z as i32;
+    }
+}
+
+/// Color for a raw energy value, without needing a whole `Voxel`
+pub fn energy_color(energy: f64, max_energy: f64) -> [f32; 3] {
+    let normalized = (energy / max_energy.max(1.0)).min(1.0) as f32;
+    // Yellow = max energy (1.0, 1.0, 0.0)
+    // Interpolate from black to yellow
+    [normalized, normalized, 0.0]
 }
 
 /// Genome: up to 10 concepts (strings)
@@ -121,10 +134,13 @@ pub struct Genome {
 }
 
 impl Genome {
+    /// Concept limit of a freshly created genome
+    pub const DEFAULT_MAX_CONCEPTS: usize = 10;
+    
     pub fn new() -> Self {
         Self {
             concepts: Vec::new(),
-            max_concepts: 10,
+            max_concepts: Self::DEFAULT_MAX_CONCEPTS,
         }
     }
     
@@ -145,85 +161,141 @@ impl Genome {
 /// Voxel World System
 #[derive(Resource)]
 pub struct VoxelWorld {
-    pub voxels: Vec<Entity>,
-    pub world: World,
+    // Every Voxel entity in `world` is listed in `voxels` and vice versa:
+    // voxels are only spawned and despawned through `add_voxel`/`remove_voxel`,
+    // so the query in `update` and the entity walk in `fill_point_cloud_data`
+    // see the same set of voxels
+    voxels: Vec<Entity>,
+    world: World,
     pub max_points: usize,
     pub trauma_mode: bool,
+    // Cached query: walks the Voxel table directly instead of per-entity lookups
+    voxel_query: QueryState<&'static mut Voxel>,
+    // Max energy seen by the last `update` pass; None until the first update
+    // and after any other world change, so a stale value is never used
+    max_energy: Option<f64>,
 }
 
 impl VoxelWorld {
     pub fn new() -> Self {
-        let world = World::new();
+        let mut world = World::new();
         let voxels = Vec::new();
+        let voxel_query = world.query::<&mut Voxel>();
         
         Self {
             voxels,
             world,
             max_points: 1_500_000_000, // 1.5 billion points
             trauma_mode: false,
+            voxel_query,
+            max_energy: None,
         }
     }
     
+    /// Entities of all voxels owned by this world, in spawn order
+    pub fn voxels(&self) -> &[Entity] {
+        &self.voxels
+    }
+    
+    /// The ECS world holding the voxel entities
+    pub fn world(&self) -> &World {
+        &self.world
+    }
+    
+    /// Mutable access to the ECS world, e.g. to run `ecs::systems` on it.
+    /// Edits may change voxel energy, so the cached max energy is dropped.
+    /// Spawn and despawn voxels through `add_voxel`/`remove_voxel` rather than
+    /// on the world directly, so the entity list stays in sync
+    pub fn world_mut(&mut self) -> &mut World {
+        self.max_energy = None;
+        &mut self.world
+    }
+    
     pub fn add_voxel(&mut self, position: [i32; 3]) -> Entity {
         let entity = self.world.spawn(Voxel::new(position)).id();
         self.voxels.push(entity);
+        self.max_energy = None;
         entity
     }
     
+    /// Despawn a voxel of this world; returns false if the entity is not one
+    pub fn remove_voxel(&mut self, entity: Entity) -> bool {
+        match self.voxels.iter().position(|&e| e == entity) {
+            Some(index) => {
+                self.voxels.remove(index);
+                self.world.despawn(entity);
+                self.max_energy = None;
+                true
+            }
+            None => false,
+        }
+    }
+    
     pub fn update(&mut self, delta_time: f32) {
         // Update voxel physics and evolution
-        // Use entity IDs to avoid borrowing issues
-        for &entity in &self.voxels.clone() {
-            if let Some(mut voxel) = self.world.get_mut::<Voxel>(entity) {
-                // Update physics
-                voxel.position[0] += voxel.velocity_x as i32;
-                voxel.position[1] += voxel.velocity_y as i32;
-                voxel.position[2] += voxel.velocity_z as i32;
-                
-                // Update energy based on resonance
-                voxel.energy += voxel.resonance.to_f32() as f64 * delta_time as f64;
-                
-                // Apply trauma mode intensity
-                if self.trauma_mode {
-                    voxel.energy *= 1.5;
-                    voxel.emotion_arousal *= 1.3;
-                }
-            }
+        // Iterate the component table through the cached query: no copy of the
+        // entity list and no per-entity location lookup
+        let dt = delta_time as f64;
+        
+        // Trauma mode intensity is world-wide: resolve it once per tick into
+        // gains (exact no-op multipliers when off) instead of branching per voxel
+        let (energy_gain, arousal_gain) = if self.trauma_mode {
+            (1.5, 1.3)
+        } else {
+            (1.0, 1.0)
+        };
+        
+        // Track the max energy while the values are hot, so point-cloud
+        // extraction does not need a separate pass over all voxels
+        let mut max_energy = 0.0f64;
+        
+        for mut voxel in self.voxel_query.iter_mut(&mut self.world) {
+            // Update physics
+            voxel.integrate_position();
+            
+            // Update energy based on resonance, then apply trauma intensity
+            voxel.energy = (voxel.energy + voxel.resonance.to_f32() as f64 * dt) * energy_gain;
+            voxel.emotion_arousal *= arousal_gain;
+            
+            max_energy = max_energy.max(voxel.energy);
         }
+        
+        self.max_energy = Some(max_energy);
     }
     
     pub fn get_point_cloud_data(&self) -> Vec<([f32; 3], [f32; 3])> {
-        let mut points = Vec::new();
+        let mut points = Vec::with_capacity(self.voxels.len());
+        self.fill_point_cloud_data(&mut points);
+        points
+    }
+    
+    /// Same as `get_point_cloud_data`, but refills a caller-owned buffer so
+    /// per-frame callers keep its allocation instead of getting a new Vec
+    pub fn fill_point_cloud_data(&self, points: &mut Vec<([f32; 3], [f32; 3])>) {
+        points.clear();
+        points.reserve(self.voxels.len());
         
-        // Collect voxel data first to avoid borrowing issues
         // Note: bevy_ecs query requires mutable world, so we use entity IDs
-        let voxel_data: Vec<([i32; 3], f64)> = self.voxels.iter()
-            .filter_map(|&entity| {
-                self.world.get::<Voxel>(entity)
-                    .map(|v| (v.position, v.energy))
-            })
-            .collect();
+        let voxels = || self.voxels.iter()
+            .filter_map(|&entity| self.world.get::<Voxel>(entity));
         
-        let max_energy = voxel_data.iter()
-            .map(|(_, energy)| *energy)
-            .fold(0.0, f64::max);
+        // Max energy comes from the last update pass. Every other way to change
+        // the world (spawning, despawning, `world_mut`) clears it, so a scan is
+        // needed only before the first update or right after such a change
+        let max_energy = self.max_energy.unwrap_or_else(|| {
+            voxels()
+                .map(|v| v.energy)
+                .fold(0.0, f64::max)
+        });
         
-        for (position, energy) in voxel_data {
+        for voxel in voxels() {
             let pos = [
-                position[0] as f32,
-                position[1] as f32,
-                position[2] as f32,
+                voxel.position[0] as f32,
+                voxel.position[1] as f32,
+                voxel.position[2] as f32,
             ];
-            // Create temporary voxel for color calculation
-            let temp_voxel = Voxel {
-                energy,
-                ..Voxel::new([0, 0, 0])
-            };
-            let color = temp_voxel.get_energy_color(max_energy);
-            points.push((pos, color));
+            points.push((pos, energy_color(voxel.energy, max_energy)));
         }
-        
-        points
     }
 }
 
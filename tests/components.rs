@@ -0,0 +1,150 @@
+// Core component tests (no GUI dependencies)
+use adaptive_entity_engine::lighting::LightPattern;
+use adaptive_entity_engine::{
+    ArchGuard, EvolutionEngine, Genome, LightingSystem, Voxel, VoxelWorld,
+};
+
+#[test]
+fn voxel_creation() {
+    let voxel = Voxel::new([0, 0, 0]);
+    assert_eq!(voxel.position, [0, 0, 0]);
+    assert_eq!(voxel.energy, 0.0);
+    assert!(voxel.genome.concepts.is_empty());
+    assert_eq!(voxel.resonance.to_f32(), 0.0);
+}
+
+#[test]
+fn genome_respects_max_concepts() {
+    let mut genome = Genome::new();
+    assert!(genome.add_concept("concept1".to_string()));
+    assert!(genome.add_concept("concept2".to_string()));
+    assert_eq!(genome.concepts, vec!["concept1", "concept2"]);
+
+    for i in 2..genome.max_concepts {
+        assert!(genome.add_concept(format!("concept{}", i + 1)));
+    }
+    assert!(!genome.add_concept("overflow".to_string()));
+    assert_eq!(genome.concepts.len(), genome.max_concepts);
+}
+
+#[test]
+fn evolution_fitness_and_evolve() {
+    let evolution = EvolutionEngine::new();
+
+    let mut test_voxel = Voxel::new([1, 1, 1]);
+    test_voxel.energy = 0.8;
+    test_voxel.genome.add_concept("test".to_string());
+    let fitness = evolution.fitness(&test_voxel);
+    assert!(fitness > evolution.fitness(&Voxel::new([1, 1, 1])));
+
+    let mut population: Vec<Voxel> = (0..8).map(|i| Voxel::new([i, 0, 0])).collect();
+    population[0].genome.add_concept("a".to_string());
+    population[1].genome.add_concept("b".to_string());
+    evolution.evolve(&mut population);
+    assert_eq!(population.len(), 8);
+    assert!(population
+        .iter()
+        .all(|v| v.genome.concepts.len() <= v.genome.max_concepts));
+}
+
+#[test]
+fn evolve_crossover_children_use_default_max_concepts() {
+    let mut evolution = EvolutionEngine::new();
+    evolution.crossover_rate = 1.0;
+    evolution.mutation_rate = 0.0;
+
+    // Two rich parents up front, then two slots to be replaced whose genomes
+    // carry a non-default limit and get recycled as scratch buffers
+    let mut population: Vec<Voxel> = (0..4).map(|i| Voxel::new([i, 0, 0])).collect();
+    for parent in &mut population[..2] {
+        for c in 0..Genome::DEFAULT_MAX_CONCEPTS {
+            parent.genome.add_concept(format!("c{}", c));
+        }
+    }
+    for replaced in &mut population[2..] {
+        replaced.genome.max_concepts = 1;
+    }
+
+    evolution.evolve(&mut population);
+    for child in &population[2..] {
+        assert_eq!(child.genome.max_concepts, Genome::DEFAULT_MAX_CONCEPTS);
+        assert_eq!(child.genome.concepts.len(), Genome::DEFAULT_MAX_CONCEPTS);
+    }
+}
+
+#[test]
+fn voxel_world_update_and_point_cloud() {
+    let mut world = VoxelWorld::new();
+    world.add_voxel([10, 20, 30]);
+    world.add_voxel([15, 25, 35]);
+    assert_eq!(world.voxels().len(), 2);
+
+    world.trauma_mode = true;
+    world.update(0.016); // ~60 FPS delta
+
+    let points = world.get_point_cloud_data();
+    assert_eq!(points.len(), 2);
+    assert_eq!(points[0].0, [10.0, 20.0, 30.0]);
+    assert_eq!(points[1].0, [15.0, 25.0, 35.0]);
+}
+
+#[test]
+fn voxel_world_remove_voxel() {
+    let mut world = VoxelWorld::new();
+    let first = world.add_voxel([1, 2, 3]);
+    world.add_voxel([4, 5, 6]);
+    world.update(0.016);
+
+    assert!(world.remove_voxel(first));
+    assert!(!world.remove_voxel(first));
+    assert_eq!(world.voxels().len(), 1);
+    assert!(world.world().get::<Voxel>(first).is_none());
+
+    let points = world.get_point_cloud_data();
+    assert_eq!(points.len(), 1);
+    assert_eq!(points[0].0, [4.0, 5.0, 6.0]);
+}
+
+#[test]
+fn lighting_system_update() {
+    let mut lighting = LightingSystem::new();
+    lighting.add_pattern(LightPattern::new());
+    lighting.add_pattern(LightPattern::new());
+    lighting.update_lighting(1.0);
+
+    let expected = (1.0f32 * 0.5).sin() * 0.5 + 0.5;
+    for pattern in &lighting.patterns {
+        let direct = pattern.direct_light;
+        assert!((direct.to_f32() - expected).abs() < 1e-3);
+    }
+}
+
+#[test]
+fn archguard_rhythm_phase() {
+    let mut archguard = ArchGuard::new();
+    assert!(!archguard.is_circuit_open());
+
+    // Phase is the fraction of the 0.038 Hz period elapsed since the first sample
+    let frequency: f64 = 0.038;
+    let (start, now): (f64, f64) = (0.0, 10.0);
+    archguard.update_rhythm(start);
+    archguard.update_rhythm(now);
+    let expected = ((now - start) * frequency).rem_euclid(1.0);
+    assert!((archguard.get_rhythm_phase() - expected).abs() < 1e-9);
+}
+
+#[test]
+fn archguard_empathy_ratio() {
+    let archguard = ArchGuard::new();
+    let rt = tokio::runtime::Builder::new_current_thread()
+        .enable_all()
+        .build()
+        .unwrap();
+    rt.block_on(async {
+        archguard.update_empathy_ratio(0.75).await;
+        assert_eq!(archguard.get_empathy_ratio().await, 0.75);
+
+        archguard.update_empathy_ratio(1.5).await;
+        assert_eq!(archguard.get_empathy_ratio().await, 1.0);
+    });
+}